@@ -3,11 +3,18 @@ Timeline view UI for ActivityMonitor.
 Shows a visual breakdown of activities throughout the day.
 """
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+import bisect
+import functools
+import itertools
 import logging
+import sys
 
 import tkinter as tk
+import tkinter.font as tkfont
 
 try:
     import ttkbootstrap as ttk
@@ -36,6 +43,106 @@ PROJECT_COLORS = [
     '#E67E22',  # Dark Orange
 ]
 
+# Shown for activities without a project; interned so names can be compared by identity
+UNCATEGORIZED = sys.intern('Uncategorized')
+
+# Delay used to coalesce bursts of resize/zoom events into one redraw
+REDRAW_DELAY_MS = 50
+
+# Delay after the last keystroke before the activity filter is applied
+FILTER_DELAY_MS = 150
+
+# Number of past days kept in the timeline's day cache
+DAY_CACHE_SIZE = 30
+
+# Window titles longer than this are cut (with '...') in the activity list
+WINDOW_TITLE_MAX_CHARS = 80
+
+# Activity list rows inserted up front, and per page as the user scrolls down
+LIST_PAGE_SIZE = 100
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """
+    Parse an activity timestamp.
+
+    The database writes 'YYYY-MM-DD HH:MM:SS', which is sliced directly; any
+    other form falls back to datetime.fromisoformat.
+    """
+    if len(value) == 19:
+        try:
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                            int(value[11:13]), int(value[14:16]), int(value[17:19]))
+        except ValueError:
+            pass
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _truncate(name: str, max_chars: int) -> str:
+    """Truncate a segment label to max_chars, marking the cut with '..'."""
+    if len(name) <= max_chars:
+        return name
+    return name[:max_chars - 2] + ".."
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_duration(seconds: int) -> str:
+    """Format seconds as human-readable duration."""
+    if seconds < 60:
+        return f"{seconds}s"
+
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+@functools.lru_cache(maxsize=64)
+def _grid_marks(zoom_start: float, zoom_end: float, margin: int, bar_width: int) -> tuple:
+    """Return the (x, "HH:MM") time markers for a zoom range and bar geometry."""
+    zoom_range = zoom_end - zoom_start
+
+    # Calculate appropriate time label interval based on zoom level
+    if zoom_range <= 1:
+        # 1 hour or less: show every 10 minutes
+        label_interval_minutes = 10
+    elif zoom_range <= 3:
+        # 3 hours or less: show every 30 minutes
+        label_interval_minutes = 30
+    elif zoom_range <= 6:
+        # 6 hours or less: show every hour
+        label_interval_minutes = 60
+    elif zoom_range <= 12:
+        # 12 hours or less: show every 2 hours
+        label_interval_minutes = 120
+    else:
+        # Full day: show every 3 hours
+        label_interval_minutes = 180
+
+    start_minutes = int(zoom_start * 60)
+    end_minutes = int(zoom_end * 60)
+
+    # Round to label interval
+    first_label = (start_minutes // label_interval_minutes) * label_interval_minutes
+    if first_label < start_minutes:
+        first_label += label_interval_minutes
+
+    marks = []
+    for minutes in range(first_label, end_minutes + 1, label_interval_minutes):
+        hour = minutes // 60
+        minute = minutes % 60
+        time_hours = minutes / 60
+
+        # Position relative to zoom range
+        x = margin + ((time_hours - zoom_start) / zoom_range) * bar_width
+
+        if margin <= x <= margin + bar_width:
+            marks.append((x, f"{hour:02d}:{minute:02d}"))
+    return tuple(marks)
+
 
 class TimelineView:
     """
@@ -51,17 +158,45 @@ class TimelineView:
         self.config_manager = config_manager
         self.window: Optional[tk.Toplevel] = None
         self._color_map: Dict[str, str] = {}
-        self._color_index = 0
+        self._next_color = itertools.cycle(PROJECT_COLORS)  # Hands out colors to new projects
         self._selected_date = datetime.now()
         self._tooltip = None
-        self._segment_data: Dict[int, Dict] = {}  # Maps canvas item id to segment data
-        self._timeline_activities: List[Dict] = []  # Store activities for redraw on resize
+        # Hover index built at draw time: x extent of each drawn segment, in x order
+        self._seg_x_starts: List[float] = []
+        self._seg_x_ends: List[float] = []
+        self._seg_list: List[Dict] = []
+        self._seg_y_range = (0, 0)  # Vertical extent of the segment bar
+        self._motion_event = None  # Latest motion event awaiting a tooltip update
+        self._motion_after_id = None
+        self._segment_items: Dict[tuple, int] = {}  # Maps segment key to its rectangle id (reused across redraws)
+        self._label_items: Dict[tuple, int] = {}  # Maps segment key to its label id (reused across redraws)
+        self._project_tags: Dict[str, str] = {}  # Maps project name to its canvas tag
+        self._grid_label_ids: List[int] = []  # Time marker labels, reused across redraws
+        self._grid_line_ids: List[int] = []  # Time marker grid lines, parallel to _grid_label_ids
+        self._background_id: Optional[int] = None  # Background bar rectangle
+        self._label_font: Optional[tkfont.Font] = None  # Segment label font (created with the canvas)
+        self._avg_char_w = 7  # Measured label glyph width in pixels
+        self._day_model: Dict[str, List] = self._build_day_model([], self._selected_date)  # Grouped activities, reused on resize
+        self._day_cache: 'OrderedDict[tuple, Dict]' = OrderedDict()  # LRU of past days' summary and day model (per showing)
+
+        # Background database queries (created on first refresh)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_fetch: Optional[Future] = None  # Latest submitted query, cancelled if superseded
+        self._refresh_token = 0  # Incremented per refresh; stale query results are ignored
+        self._loading = False
 
         # Zoom state (time range in hours, 0-24)
         self._zoom_start = 0  # Start hour (0 = midnight)
         self._zoom_end = 24   # End hour (24 = midnight next day)
         self._min_zoom_range = 0.5  # Minimum 30 minutes
 
+        # Inputs of the last drawn timeline; a redraw with the same inputs is skipped
+        self._last_draw_key = None
+
+        # Pending debounced redraw and filter (after() ids)
+        self._redraw_after_id = None
+        self._filter_after_id = None
+
     def _get_hidden_categories(self) -> List[str]:
         """Get list of categories to hide."""
         if self.config_manager:
@@ -76,21 +211,24 @@ class TimelineView:
 
     def _get_project_color(self, project_name: str) -> str:
         """Get a consistent color for a project."""
-        if project_name not in self._color_map:
-            self._color_map[project_name] = PROJECT_COLORS[self._color_index % len(PROJECT_COLORS)]
-            self._color_index += 1
-        return self._color_map[project_name]
+        color = self._color_map.get(project_name)
+        if color is None:
+            color = self._color_map.setdefault(project_name, next(self._next_color))
+        return color
 
     def show(self, date: Optional[datetime] = None):
         """Show the timeline window."""
-        print(">>> DEBUG: TimelineView.show() called")
+        logger.debug("TimelineView.show() called")
+        # Past days can still change (e.g. manual entries from the report view),
+        # so cached days only live while the window stays open
+        self._day_cache.clear()
         if date:
             self._selected_date = date
 
         if self.window is not None:
             try:
                 if self.window.winfo_exists():
-                    print(">>> DEBUG: Timeline window exists, lifting")
+                    logger.debug("Timeline window exists, lifting")
                     self.window.deiconify()
                     self.window.lift()
                     self.window.focus_force()
@@ -99,19 +237,19 @@ class TimelineView:
             except Exception:
                 self.window = None
 
-        print(">>> DEBUG: Creating new timeline window")
+        logger.debug("Creating new timeline window")
         self._create_window()
         self._refresh()
 
         # Force window to be visible and on top
-        print(">>> DEBUG: Making timeline window visible")
+        logger.debug("Making timeline window visible")
         self.window.deiconify()
         self.window.attributes('-topmost', True)  # Force on top
         self.window.lift()
         self.window.focus_force()
         self.window.update()
         self.window.attributes('-topmost', False)  # Allow other windows on top later
-        print(">>> DEBUG: Timeline window should now be visible")
+        logger.debug("Timeline window should now be visible")
 
     def _create_window(self):
         """Create the timeline window."""
@@ -184,31 +322,39 @@ class TimelineView:
         zoom_frame = ttk.Frame(parent)
         zoom_frame.pack(fill=tk.X, pady=(0, 10))
 
-        # From time
+        # From time (hours)
         ttk.Label(zoom_frame, text="From:").pack(side=tk.LEFT)
-        self._from_hour_var = tk.StringVar(value="00:00")
-        from_combo = ttk.Combobox(
+        self._zoom_start_var = tk.DoubleVar(value=0.0)
+        from_spin = ttk.Spinbox(
             zoom_frame,
-            textvariable=self._from_hour_var,
-            values=self._get_time_values(),
+            textvariable=self._zoom_start_var,
+            from_=0,
+            to=24.0,
+            increment=0.5,
+            format='%.1f',
             width=6,
-            state='readonly'
+            command=self._on_zoom_range_change
         )
-        from_combo.pack(side=tk.LEFT, padx=(5, 15))
-        from_combo.bind('<<ComboboxSelected>>', self._on_zoom_range_change)
+        from_spin.pack(side=tk.LEFT, padx=(5, 15))
+        from_spin.bind('<Return>', self._on_zoom_range_change)
+        from_spin.bind('<FocusOut>', self._on_zoom_range_change)
 
-        # To time
+        # To time (hours)
         ttk.Label(zoom_frame, text="To:").pack(side=tk.LEFT)
-        self._to_hour_var = tk.StringVar(value="24:00")
-        to_combo = ttk.Combobox(
+        self._zoom_end_var = tk.DoubleVar(value=24.0)
+        to_spin = ttk.Spinbox(
             zoom_frame,
-            textvariable=self._to_hour_var,
-            values=self._get_time_values(),
+            textvariable=self._zoom_end_var,
+            from_=0,
+            to=24.0,
+            increment=0.5,
+            format='%.1f',
             width=6,
-            state='readonly'
+            command=self._on_zoom_range_change
         )
-        to_combo.pack(side=tk.LEFT, padx=(5, 15))
-        to_combo.bind('<<ComboboxSelected>>', self._on_zoom_range_change)
+        to_spin.pack(side=tk.LEFT, padx=(5, 15))
+        to_spin.bind('<Return>', self._on_zoom_range_change)
+        to_spin.bind('<FocusOut>', self._on_zoom_range_change)
 
         # Zoom buttons
         ttk.Button(zoom_frame, text="🔍+", width=4, command=self._zoom_in).pack(side=tk.LEFT, padx=2)
@@ -219,35 +365,30 @@ class TimelineView:
         self._zoom_label = ttk.Label(zoom_frame, text="", font=('Segoe UI', 9), foreground='#888')
         self._zoom_label.pack(side=tk.RIGHT)
 
-    def _get_time_values(self) -> List[str]:
-        """Generate time values for combo boxes (every 30 minutes)."""
-        times = []
-        for hour in range(25):  # 0-24
-            if hour < 24:
-                times.append(f"{hour:02d}:00")
-                times.append(f"{hour:02d}:30")
-            else:
-                times.append("24:00")
-        return times
-
     def _on_zoom_range_change(self, event=None):
-        """Handle zoom range change from combo boxes."""
-        from_str = self._from_hour_var.get()
-        to_str = self._to_hour_var.get()
+        """Handle zoom range change from the spin boxes."""
+        try:
+            zoom_start = self._zoom_start_var.get()
+            zoom_end = self._zoom_end_var.get()
+        except tk.TclError:
+            # Non-numeric text typed into a spin box; restore the current range
+            self._update_zoom_combos()
+            return
 
-        # Parse time strings to hours
-        from_parts = from_str.split(':')
-        to_parts = to_str.split(':')
+        # Spin boxes still show the (rounded) current zoom, e.g. on focus loss
+        # after a wheel zoom: keep the exact range instead of snapping to it
+        if (zoom_start, zoom_end) == self._rounded_zoom():
+            return
 
-        self._zoom_start = int(from_parts[0]) + int(from_parts[1]) / 60
-        self._zoom_end = int(to_parts[0]) + int(to_parts[1]) / 60
+        self._zoom_start = max(0.0, min(24.0, zoom_start))
+        self._zoom_end = max(0.0, min(24.0, zoom_end))
 
         # Ensure valid range
         if self._zoom_end <= self._zoom_start:
             self._zoom_end = self._zoom_start + self._min_zoom_range
 
         self._update_zoom_label()
-        self._draw_timeline()
+        self._schedule_redraw()
 
     def _zoom_in(self):
         """Zoom in (reduce time range by 50%, centered)."""
@@ -260,7 +401,7 @@ class TimelineView:
 
         self._update_zoom_combos()
         self._update_zoom_label()
-        self._draw_timeline()
+        self._schedule_redraw()
 
     def _zoom_out(self):
         """Zoom out (increase time range by 100%, centered)."""
@@ -279,7 +420,7 @@ class TimelineView:
 
         self._update_zoom_combos()
         self._update_zoom_label()
-        self._draw_timeline()
+        self._schedule_redraw()
 
     def _zoom_reset(self):
         """Reset zoom to full day view."""
@@ -287,7 +428,7 @@ class TimelineView:
         self._zoom_end = 24
         self._update_zoom_combos()
         self._update_zoom_label()
-        self._draw_timeline()
+        self._schedule_redraw()
 
     def _zoom_to_range(self, start_hour: float, end_hour: float):
         """Zoom to a specific time range."""
@@ -297,21 +438,17 @@ class TimelineView:
             self._zoom_end = self._zoom_start + self._min_zoom_range
         self._update_zoom_combos()
         self._update_zoom_label()
-        self._draw_timeline()
+        self._schedule_redraw()
+
+    def _rounded_zoom(self) -> tuple:
+        """Return the current zoom range as shown in the spin boxes (nearest 30 minutes)."""
+        return round(self._zoom_start * 2) / 2, min(24.0, round(self._zoom_end * 2) / 2)
 
     def _update_zoom_combos(self):
-        """Update combo boxes to reflect current zoom state."""
-        # Round to nearest 30 minutes for combo display
-        start_h = int(self._zoom_start)
-        start_m = 30 if (self._zoom_start % 1) >= 0.25 else 0
-        end_h = int(self._zoom_end)
-        end_m = 30 if (self._zoom_end % 1) >= 0.25 else 0
-
-        self._from_hour_var.set(f"{start_h:02d}:{start_m:02d}")
-        if end_h >= 24:
-            self._to_hour_var.set("24:00")
-        else:
-            self._to_hour_var.set(f"{end_h:02d}:{end_m:02d}")
+        """Update spin boxes to reflect current zoom state (nearest 30 minutes)."""
+        zoom_start, zoom_end = self._rounded_zoom()
+        self._zoom_start_var.set(zoom_start)
+        self._zoom_end_var.set(zoom_end)
 
     def _update_zoom_label(self):
         """Update zoom info label."""
@@ -338,12 +475,24 @@ class TimelineView:
         )
         self._timeline_canvas.pack(fill=tk.X, padx=5, pady=5)
 
-        # Bind resize event
-        self._timeline_canvas.bind('<Configure>', lambda e: self._draw_timeline())
+        # Measure the label font once; used to fit segment labels
+        self._label_font = tkfont.Font(root=self.window, family='Segoe UI', size=8)
+        self._avg_char_w = self._label_font.measure('0') or 7
+
+        # Item ids from a previous window are meaningless on the new canvas
+        self._last_draw_key = None
+        self._segment_items.clear()
+        self._label_items.clear()
+        self._grid_label_ids.clear()
+        self._grid_line_ids.clear()
+        self._background_id = None
+
+        # Bind resize event (debounced, Tk fires <Configure> for every pixel of a drag)
+        self._timeline_canvas.bind('<Configure>', self._schedule_redraw)
 
         # Bind tooltip events
         self._timeline_canvas.bind('<Motion>', self._on_canvas_motion)
-        self._timeline_canvas.bind('<Leave>', self._hide_tooltip)
+        self._timeline_canvas.bind('<Leave>', self._on_canvas_leave)
 
         # Bind zoom events
         self._timeline_canvas.bind('<Double-Button-1>', self._on_canvas_double_click)
@@ -352,19 +501,36 @@ class TimelineView:
         self._timeline_canvas.bind('<Button-5>', lambda e: self._on_canvas_mousewheel_linux(e, -1))  # Linux scroll down
 
     def _on_canvas_motion(self, event):
-        """Handle mouse motion over the timeline canvas."""
-        # Find item under cursor
-        items = self._timeline_canvas.find_overlapping(event.x - 1, event.y - 1, event.x + 1, event.y + 1)
-
-        # Look for a segment
-        for item_id in items:
-            if item_id in self._segment_data:
-                segment = self._segment_data[item_id]
-                self._show_tooltip(event, segment)
+        """Handle mouse motion over the timeline canvas (throttled to one update per 30ms)."""
+        self._motion_event = event
+        if self._motion_after_id is None:
+            self._motion_after_id = self.window.after(30, self._update_hover)
+
+    def _update_hover(self):
+        """Show the tooltip for the segment under the latest mouse position."""
+        self._motion_after_id = None
+        event = self._motion_event
+        if event is None:
+            return
+
+        # Binary search the drawn segments by x
+        y1, y2 = self._seg_y_range
+        if y1 - 1 <= event.y <= y2 + 1:
+            index = bisect.bisect_right(self._seg_x_starts, event.x) - 1
+            if index >= 0 and self._seg_x_ends[index] >= event.x:
+                self._show_tooltip(event, self._seg_list[index])
                 return
 
         self._hide_tooltip()
 
+    def _on_canvas_leave(self, event=None):
+        """Drop pending hover updates and hide the tooltip."""
+        if self._motion_after_id is not None:
+            self.window.after_cancel(self._motion_after_id)
+            self._motion_after_id = None
+        self._motion_event = None
+        self._hide_tooltip()
+
     def _show_tooltip(self, event, segment: Dict):
         """Show tooltip with segment information."""
         if self._tooltip is None:
@@ -434,7 +600,7 @@ class TimelineView:
 
         self._update_zoom_combos()
         self._update_zoom_label()
-        self._draw_timeline()
+        self._schedule_redraw()
 
     def _on_canvas_mousewheel(self, event):
         """Handle mousewheel zoom on Windows."""
@@ -483,7 +649,7 @@ class TimelineView:
 
         self._update_zoom_combos()
         self._update_zoom_label()
-        self._draw_timeline()
+        self._schedule_redraw()
 
     def _create_activity_list(self, parent):
         """Create the scrollable activity list with search filter."""
@@ -496,7 +662,7 @@ class TimelineView:
 
         ttk.Label(search_frame, text="Filter:").pack(side=tk.LEFT)
         self._filter_var = tk.StringVar()
-        self._filter_var.trace('w', lambda *args: self._apply_filter())
+        self._filter_var.trace('w', lambda *args: self._schedule_filter())
         filter_entry = ttk.Entry(search_frame, textvariable=self._filter_var, width=30)
         filter_entry.pack(side=tk.LEFT, padx=(5, 10))
 
@@ -522,23 +688,35 @@ class TimelineView:
         self._activity_tree.column('project', width=150, minwidth=100)
         self._activity_tree.column('window', width=400, minwidth=200)
 
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._activity_tree.yview)
-        self._activity_tree.configure(yscrollcommand=scrollbar.set)
+        self._scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._activity_tree.yview)
+        self._activity_tree.configure(yscrollcommand=self._on_list_scroll)
 
         self._activity_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Store grouped rows for filtering
+        self._current_rows: List[Dict] = []
 
-        # Store activities for filtering
-        self._current_activities: List[Dict] = []
+        # Lazily formatted rows not yet inserted into the treeview
+        self._pending_values: Optional[Iterator[tuple]] = None
 
     def _clear_filter(self):
         """Clear the filter entry."""
         self._filter_var.set("")
 
+    def _schedule_filter(self):
+        """Apply the filter once typing pauses, instead of on every keystroke."""
+        if self.window is None:
+            return
+        if self._filter_after_id is not None:
+            self.window.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.window.after(FILTER_DELAY_MS, self._apply_filter)
+
     def _apply_filter(self):
         """Apply filter to activity list."""
+        self._filter_after_id = None
         filter_text = self._filter_var.get().lower().strip()
-        self._update_activity_list(self._current_activities, filter_text)
+        self._update_activity_list(filter_text=filter_text)
 
     def _create_summary_panel(self, parent):
         """Create the summary panel."""
@@ -565,48 +743,161 @@ class TimelineView:
         hidden_categories = self._get_hidden_categories()
         hidden_apps = self._get_hidden_apps()
 
-        # Get data from database with filtering
-        print(f">>> DEBUG: Fetching activities for {self._selected_date.date()}")
-        activities = self.db.get_activities_for_date(
-            self._selected_date, hidden_categories, hidden_apps
+        # Past days are served from the cache after the first visit while the window is open
+        cache_key = (
+            self._selected_date.date(),
+            tuple(sorted(hidden_categories)),
+            tuple(sorted(hidden_apps))
         )
-        summary = self.db.get_daily_summary(
-            self._selected_date, hidden_categories, hidden_apps
+
+        # Newer refreshes invalidate results of queries still in flight
+        self._refresh_token += 1
+        token = self._refresh_token
+        # A query still queued for a day we navigated away from need not run at all
+        if self._pending_fetch is not None:
+            self._pending_fetch.cancel()
+            self._pending_fetch = None
+
+        entry = self._day_cache.get(cache_key)
+        if entry is not None:
+            self._day_cache.move_to_end(cache_key)
+            self._apply_day(entry)
+            return
+
+        # Query the database off the UI thread, showing placeholders meanwhile
+        self._loading = True
+        self._day_model = self._build_day_model([], self._selected_date)
+        self._last_draw_key = None
+        self._draw_timeline()
+        self._update_activity_list([])
+        self._set_summary_text("Loading…")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="timeline-db")
+        future = self._executor.submit(
+            self._fetch_day, self._selected_date, hidden_categories, hidden_apps
         )
-        print(f">>> DEBUG: Found {len(activities)} activities, {len(summary)} summary items")
+        future.add_done_callback(lambda f: self._on_fetch_done(f, token, cache_key))
+        self._pending_fetch = future
+
+    def _fetch_day(self, date: datetime, hidden_categories: List[str],
+                   hidden_apps: List[str]) -> tuple:
+        """Load and group a day's activities, and its summary (runs on the worker thread)."""
+        logger.debug("Fetching timeline activities for %s", date.date())
+        activities = self.db.get_activities_for_date(date, hidden_categories, hidden_apps)
+        summary = self.db.get_daily_summary(date, hidden_categories, hidden_apps)
+        logger.debug("Found %d activities, %d summary items", len(activities), len(summary))
+
+        # Parse timestamps and normalize project names once per load, here rather
+        # than on the UI thread. Names are interned so grouping can compare by identity.
+        intern = sys.intern
+        parse_timestamp = _parse_timestamp
+        for activity in activities:
+            activity['_ts'] = parse_timestamp(activity['timestamp'])
+            activity['_end_ts'] = activity['_ts'] + timedelta(seconds=activity['duration_seconds'])
+            project = activity['project_name']
+            activity['_project'] = intern(project) if project else UNCATEGORIZED
+
+        # Group on the worker too; the UI thread only applies the finished model
+        day_start = datetime.combine(date.date(), datetime.min.time())
+        return self._build_day_model(activities, day_start), summary
+
+    def _on_fetch_done(self, future: Future, token: int, cache_key: tuple):
+        """Hand a finished query back to the UI thread (runs on the worker thread)."""
+        window = self.window
+        if window is None:
+            return
+        try:
+            window.after(0, self._apply_fetch, future, token, cache_key)
+        except Exception as e:
+            # Window was closed while the query was running
+            logger.debug(f"Timeline fetch result dropped: {e}")
+
+    def _apply_fetch(self, future: Future, token: int, cache_key: tuple):
+        """Show fetched data, unless a newer refresh superseded it."""
+        if self.window is None or token != self._refresh_token:
+            return
+        self._loading = False
+        self._pending_fetch = None
+
+        try:
+            model, summary = future.result()
+        except Exception as e:
+            logger.error(f"Error loading timeline data: {e}")
+            self._draw_timeline()
+            self._set_summary_text("Could not load activities for this day.")
+            return
+
+        entry = {'summary': summary, 'model': model}
+        if cache_key[0] < datetime.now().date():
+            self._day_cache[cache_key] = entry
+            if len(self._day_cache) > DAY_CACHE_SIZE:
+                self._day_cache.popitem(last=False)
+
+        self._apply_day(entry)
+
+    def _apply_day(self, entry: Dict):
+        """Show a day's grouped data in the timeline, activity list and summary."""
+        self._loading = False
+        self._day_model = entry['model']
+        self._last_draw_key = None
 
-        # Store activities for redraw on resize
-        self._timeline_activities = activities
+        # Assign colors to the day's projects once (in order of appearance) so
+        # redraws only do a dict lookup per segment
+        for project in dict.fromkeys(s['project'] for s in self._day_model['segments'] if s['is_active']):
+            self._get_project_color(project)
 
         # Update timeline canvas
-        self._draw_timeline(activities)
+        self._draw_timeline()
 
         # Update activity list
-        self._update_activity_list(activities)
+        self._update_activity_list(self._day_model['rows'])
 
         # Update summary
-        self._update_summary(summary)
+        self._update_summary(entry['summary'])
 
-    def _draw_timeline(self, activities: Optional[List[Dict]] = None):
+    def _schedule_redraw(self, event=None):
+        """Schedule a timeline redraw, coalescing rapid resize/zoom events into one."""
+        if self.window is None:
+            return
+        if self._redraw_after_id is not None:
+            self.window.after_cancel(self._redraw_after_id)
+        self._redraw_after_id = self.window.after(REDRAW_DELAY_MS, self._draw_timeline)
+
+    def _draw_timeline(self):
         """Draw the timeline visualization with zoom support."""
-        # Use stored activities if none provided (e.g., on resize)
-        if activities is None:
-            activities = self._timeline_activities
+        # Drawing now supersedes any pending debounced redraw
+        if self._redraw_after_id is not None:
+            self.window.after_cancel(self._redraw_after_id)
+            self._redraw_after_id = None
 
-        canvas = self._timeline_canvas
-        canvas.delete('all')
-        self._segment_data.clear()  # Clear tooltip data
+        # Reuse the grouped segments from the last refresh (e.g., on resize)
+        segments = self._day_model['segments']
 
+        canvas = self._timeline_canvas
         width = canvas.winfo_width()
         height = canvas.winfo_height()
 
+        # Nothing to do if neither size, zoom, data nor loading state changed (spurious <Configure>)
+        draw_key = (width, height, self._zoom_start, self._zoom_end, id(self._day_model), self._loading)
+        if draw_key == self._last_draw_key:
+            return
+        self._last_draw_key = draw_key
+
+        # Grid, background and segment items are updated in place below
+        canvas.delete('message')
+        # Clear tooltip data
+        self._seg_x_starts = []
+        self._seg_x_ends = []
+        self._seg_list = []
+
         if width < 10:
+            self._clear_grid_items()
             return
 
         # Zoom range in hours
         zoom_start = self._zoom_start
         zoom_end = self._zoom_end
-        zoom_range = zoom_end - zoom_start
 
         # Draw time markers
         bar_top = 30
@@ -614,73 +905,118 @@ class TimelineView:
         margin = 30
         bar_width = width - 2 * margin
 
-        # Calculate appropriate time label interval based on zoom level
-        if zoom_range <= 1:
-            # 1 hour or less: show every 10 minutes
-            label_interval_minutes = 10
-        elif zoom_range <= 3:
-            # 3 hours or less: show every 30 minutes
-            label_interval_minutes = 30
-        elif zoom_range <= 6:
-            # 6 hours or less: show every hour
-            label_interval_minutes = 60
-        elif zoom_range <= 12:
-            # 12 hours or less: show every 2 hours
-            label_interval_minutes = 120
-        else:
-            # Full day: show every 3 hours
-            label_interval_minutes = 180
-
-        # Draw time labels and grid lines
-        start_minutes = int(zoom_start * 60)
-        end_minutes = int(zoom_end * 60)
-
-        # Round to label interval
-        first_label = (start_minutes // label_interval_minutes) * label_interval_minutes
-        if first_label < start_minutes:
-            first_label += label_interval_minutes
-
-        for minutes in range(first_label, end_minutes + 1, label_interval_minutes):
-            hour = minutes // 60
-            minute = minutes % 60
-            time_hours = minutes / 60
-
-            # Position relative to zoom range
-            x = margin + ((time_hours - zoom_start) / zoom_range) * bar_width
-
-            if margin <= x <= width - margin:
-                time_str = f"{hour:02d}:{minute:02d}"
-                canvas.create_text(x, 15, text=time_str, font=('Segoe UI', 8), fill='#666')
-                canvas.create_line(x, bar_top, x, bar_top + bar_height, fill='#ddd', dash=(2, 2))
-
-        # Draw background bar
-        canvas.create_rectangle(
-            margin, bar_top,
-            width - margin, bar_top + bar_height,
-            fill='#eee', outline='#ccc'
-        )
+        # Draw time labels, grid lines and the background bar
+        self._draw_grid(_grid_marks(zoom_start, zoom_end, margin, bar_width),
+                        bar_top, bar_height, margin, width)
 
-        if not activities:
+        if not segments:
+            self._clear_segment_items()
             canvas.create_text(
                 width // 2, bar_top + bar_height // 2,
-                text="No activities recorded",
-                font=('Segoe UI', 10), fill='#999'
+                text="Loading…" if self._loading else "No activities recorded",
+                font=('Segoe UI', 10), fill='#999',
+                tags=('message',)
             )
             return
 
-        # Group consecutive activities by project
-        segments = self._group_activities_into_segments(activities)
-
         # Draw activity segments
-        day_start = self._selected_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        zoom_start_seconds = zoom_start * 3600
-        zoom_end_seconds = zoom_end * 3600
-        zoom_range_seconds = zoom_range * 3600
+        self._draw_segments(self._day_model, bar_top, bar_height, margin, bar_width)
 
-        for segment in segments:
-            # Calculate segment position in seconds from day start
-            start_seconds = (segment['start'] - day_start).total_seconds()
-            end_seconds = (segment['end'] - day_start).total_seconds()
+    def _draw_grid(self, marks: tuple, bar_top: int, bar_height: int, margin: int, width: int):
+        """Position the time markers and background bar, reusing existing canvas items."""
+        canvas = self._timeline_canvas
+        label_ids = self._grid_label_ids
+        line_ids = self._grid_line_ids
+        bar_bottom = bar_top + bar_height
+        created = False
+
+        for i, (x, time_str) in enumerate(marks):
+            if i < len(label_ids):
+                canvas.coords(label_ids[i], x, 15)
+                canvas.itemconfigure(label_ids[i], text=time_str)
+                canvas.coords(line_ids[i], x, bar_top, x, bar_bottom)
+            else:
+                label_ids.append(canvas.create_text(
+                    x, 15, text=time_str, font=('Segoe UI', 8), fill='#666', tags=('grid',)
+                ))
+                line_ids.append(canvas.create_line(
+                    x, bar_top, x, bar_bottom, fill='#ddd', dash=(2, 2), tags=('grid',)
+                ))
+                created = True
+
+        # Drop markers the current zoom level doesn't need
+        count = len(marks)
+        if len(label_ids) > count:
+            canvas.delete(*label_ids[count:], *line_ids[count:])
+            del label_ids[count:]
+            del line_ids[count:]
+
+        if self._background_id is None:
+            self._background_id = canvas.create_rectangle(
+                margin, bar_top,
+                width - margin, bar_bottom,
+                fill='#eee', outline='#ccc',
+                tags=('background',)
+            )
+        else:
+            canvas.coords(self._background_id, margin, bar_top, width - margin, bar_bottom)
+
+        # Keep the markers underneath the bar, as if drawn first
+        if created:
+            canvas.tag_lower('grid')
+
+    def _clear_grid_items(self):
+        """Delete the time markers and background bar from the canvas."""
+        self._timeline_canvas.delete('grid', 'background')
+        self._grid_label_ids.clear()
+        self._grid_line_ids.clear()
+        self._background_id = None
+
+    def _draw_segments(self, model: Dict[str, List], bar_top: int, bar_height: int,
+                       margin: int, bar_width: int):
+        """
+        Draw activity segments for the current zoom range.
+
+        Touching segments that end up with the same color are collapsed into a
+        single rectangle to keep the canvas item count low; tooltips find the
+        segment under the cursor through the x index built here.
+        """
+        canvas = self._timeline_canvas
+        zoom_start_seconds = self._zoom_start * 3600
+        zoom_end_seconds = self._zoom_end * 3600
+        zoom_range_seconds = zoom_end_seconds - zoom_start_seconds
+
+        # Binary search the time index for the segments that can be in view
+        starts = model['starts']
+        ends = model['ends']
+        lo = bisect.bisect_left(model['max_ends'], zoom_start_seconds)
+        hi = bisect.bisect_right(starts, zoom_end_seconds)
+        segments = model['segments']
+
+        # Project colors are assigned when the day is loaded (see _apply_day)
+        color_map_get = self._color_map.get
+
+        # Hoisted out of the loops below: x = x_origin + seconds * px_per_sec
+        px_per_sec = bar_width / zoom_range_seconds
+        x_origin = margin - zoom_start_seconds * px_per_sec
+        y1 = bar_top + 2
+        y2 = bar_top + bar_height - 2
+        y_mid = bar_top + bar_height / 2
+        create_rect = canvas.create_rectangle
+        create_txt = canvas.create_text
+        move_item = canvas.coords
+        label_font = self._label_font
+        avg_char_w = self._avg_char_w
+
+        # Segments narrower than a pixel are folded into pixel-wide blocks, so the
+        # item count is bounded by the bar width rather than the number of segments
+        placed = []  # (x1, x2, color, [(x, segment), ...]) in time order
+        mixed = None  # Sub-pixel block being accumulated
+        for i in range(lo, hi):
+            segment = segments[i]
+            # Segment position in seconds from day start
+            start_seconds = starts[i]
+            end_seconds = ends[i]
 
             # Skip segments outside zoom range
             if end_seconds < zoom_start_seconds or start_seconds > zoom_end_seconds:
@@ -691,126 +1027,265 @@ class TimelineView:
             end_seconds = min(end_seconds, zoom_end_seconds)
 
             # Calculate x positions relative to zoom range
-            x1 = margin + ((start_seconds - zoom_start_seconds) / zoom_range_seconds) * bar_width
-            x2 = margin + ((end_seconds - zoom_start_seconds) / zoom_range_seconds) * bar_width
-
-            # Ensure minimum width
-            if x2 - x1 < 2:
-                x2 = x1 + 2
+            x1 = x_origin + start_seconds * px_per_sec
+            x2 = x_origin + end_seconds * px_per_sec
 
             # Use gray for idle periods, project color for active
             if segment['is_active']:
-                color = self._get_project_color(segment['project'] or 'Uncategorized')
+                color = color_map_get(segment['project'], '#888888')
             else:
                 color = '#CCCCCC'  # Gray for idle
 
-            item_id = canvas.create_rectangle(
-                x1, bar_top + 2,
-                x2, bar_top + bar_height - 2,
-                fill=color, outline='',
-                tags=('segment',)
-            )
-            # Store segment data for tooltip
-            self._segment_data[item_id] = segment
+            if x2 - x1 < 1:
+                # A gap in the timeline ends the block: never fold across it
+                if mixed is not None and x1 > mixed['x2'] + 1:
+                    placed.append((mixed['x1'], mixed['x1'] + 2, mixed['color'], mixed['members']))
+                    mixed = None
+                # Block takes the color of its longest member
+                if mixed is None:
+                    mixed = {'x1': x1, 'x2': x2, 'color': color, 'longest': x2 - x1, 'members': []}
+                elif x2 - x1 > mixed['longest']:
+                    mixed['color'] = color
+                    mixed['longest'] = x2 - x1
+                mixed['x2'] = max(mixed['x2'], x2)
+                mixed['members'].append((x1, segment))
+                if mixed['x2'] - mixed['x1'] >= 1:
+                    placed.append((mixed['x1'], mixed['x1'] + 2, mixed['color'], mixed['members']))
+                    mixed = None
+                continue
+
+            if mixed is not None:
+                placed.append((mixed['x1'], mixed['x1'] + 2, mixed['color'], mixed['members']))
+                mixed = None
+
+            # Ensure minimum width
+            if x2 - x1 < 2:
+                x2 = x1 + 2
+
+            placed.append((x1, x2, color, [(x1, segment)]))
+
+        if mixed is not None:
+            placed.append((mixed['x1'], mixed['x1'] + 2, mixed['color'], mixed['members']))
+
+        # Hover index: every drawn segment with its start x and the end x of its rectangle
+        x_starts = []
+        x_ends = []
+        seg_list = []
+        for x1, x2, color, members in placed:
+            for x, segment in members:
+                x_starts.append(x)
+                x_ends.append(x2)
+                seg_list.append(segment)
+        self._seg_x_starts = x_starts
+        self._seg_x_ends = x_ends
+        self._seg_list = seg_list
+        self._seg_y_range = (y1, y2)
+
+        # Merge runs of same-color rectangles that touch (1px tolerance)
+        runs = []
+        for x1, x2, color, members in placed:
+            if runs and runs[-1]['color'] == color and x1 <= runs[-1]['x2'] + 1:
+                run = runs[-1]
+                run['x2'] = max(run['x2'], x2)
+                run['members'].extend(members)
+            else:
+                runs.append({'x1': x1, 'x2': x2, 'color': color, 'members': list(members)})
+
+        # Reuse canvas items of segments that are still visible; only new ones are
+        # created and only vanished ones deleted
+        old_items = self._segment_items
+        new_items = {}
+        project_tag = self._project_tag
+        for run in runs:
+            # Tag rectangles by the projects whose color they show, so a project
+            # can be recolored with one itemconfigure (see recolor_project)
+            color = run['color']
+            if color == '#CCCCCC':
+                tags = ('segment', 'idle')
+            else:
+                projects = dict.fromkeys(
+                    segment['project'] for _, segment in run['members']
+                    if segment['is_active'] and color_map_get(segment['project']) == color
+                )
+                tags = ('segment', 'active') + tuple(project_tag(project) for project in projects)
+
+            first = run['members'][0][1]
+            key = (first['start'], first['project'], first['is_active'], tags)
+            item_id = old_items.pop(key, None)
+            if item_id is None:
+                item_id = create_rect(
+                    run['x1'], y1, run['x2'], y2,
+                    fill=color, outline='',
+                    tags=tags
+                )
+            else:
+                move_item(item_id, run['x1'], y1, run['x2'], y2)
+            new_items[key] = item_id
 
+        old_labels = self._label_items
+        new_labels = {}
+        for x1, x2, color, members in placed:
             # Add project name label if segment is wide enough
             segment_width = x2 - x1
-            project_name = segment['project'] or 'Uncategorized'
+            if segment_width <= 50:  # Only show label if segment is at least 50px wide
+                continue
+            segment = members[0][1]
+
+            project_name = segment['project']
             if not segment['is_active']:
                 project_name = f"[IDLE] {project_name}"
 
-            if segment_width > 50:  # Only show label if segment is at least 50px wide
-                # Truncate name to fit
-                max_chars = int(segment_width / 7)  # Approximate chars that fit
-                display_name = project_name[:max_chars] if len(project_name) > max_chars else project_name
-                if len(project_name) > max_chars:
-                    display_name = display_name[:-2] + ".."
+            # Truncate name to fit
+            display_name = _truncate(project_name, int(segment_width / avg_char_w))
 
-                canvas.create_text(
-                    (x1 + x2) / 2, bar_top + bar_height / 2,
+            key = (segment['start'], segment['project'], segment['is_active'])
+            x_mid = (x1 + x2) / 2
+            item_id = old_labels.pop(key, None)
+            if item_id is None:
+                item_id = create_txt(
+                    x_mid, y_mid,
                     text=display_name,
-                    font=('Segoe UI', 8),
+                    font=label_font,
                     fill='white' if segment['is_active'] else '#333',
                     anchor='center',
                     tags=('label',)
                 )
-
-    def _group_activities_into_segments(self, activities: List[Dict]) -> List[Dict]:
-        """Group consecutive activities with same project into segments."""
-        if not activities:
-            return []
-
+            else:
+                move_item(item_id, x_mid, y_mid)
+                canvas.itemconfigure(item_id, text=display_name)
+            new_labels[key] = item_id
+
+        # Drop items whose segments are gone, then restore stacking over the background
+        stale = list(old_items.values()) + list(old_labels.values())
+        if stale:
+            canvas.delete(*stale)
+        self._segment_items = new_items
+        self._label_items = new_labels
+        canvas.tag_raise('segment')
+        canvas.tag_raise('label')
+
+    def _project_tag(self, project: str) -> str:
+        """Get the canvas tag for a project's segments (project names may contain tag operators)."""
+        tag = self._project_tags.get(project)
+        if tag is None:
+            tag = self._project_tags[project] = f"proj_{len(self._project_tags)}"
+        return tag
+
+    def recolor_project(self, project: str, color: str):
+        """Change a project's color, recoloring its drawn segments in a single canvas call."""
+        self._color_map[project] = color
+        if self.window is not None and project in self._project_tags:
+            self._timeline_canvas.itemconfigure(self._project_tags[project], fill=color)
+
+    def _clear_segment_items(self):
+        """Delete all segment rectangles and labels from the canvas."""
+        self._timeline_canvas.delete('segment', 'label')
+        self._segment_items.clear()
+        self._label_items.clear()
+
+    def _build_day_model(self, activities: List[Dict], day_start: datetime) -> Dict[str, List]:
+        """
+        Group consecutive activities for both the timeline and the activity list.
+
+        Walks the activities once, merging them into canvas segments (same project
+        and active state) and list rows (same project and window title) side by side.
+        Activities must carry parsed '_ts'/'_end_ts' timestamps and the interned
+        '_project' name (see _fetch_day).
+
+        Segments are also indexed by time so drawing can binary search the zoom range:
+        'starts'/'ends' hold their offsets in seconds from day_start, and 'max_ends'
+        the running maximum of 'ends' (kept sorted even if a long entry overlaps
+        later ones).
+
+        Returns:
+            Dict with 'segments', 'rows', 'starts', 'ends' and 'max_ends' lists
+        """
         segments = []
-        current_segment = None
+        rows = []
+        segment = None
+        row = None
 
         for activity in activities:
-            timestamp = datetime.fromisoformat(activity['timestamp'])
-            project = activity['project_name'] or 'Uncategorized'
+            timestamp = activity['_ts']
+            project = activity['project_name']
+            window = activity['window_title']
             is_active = activity['is_active']
             duration = activity['duration_seconds']
 
-            if current_segment is None:
-                current_segment = {
-                    'project': project,
+            segment_project = activity['_project']
+            if (segment is not None and segment['project'] is segment_project
+                    and segment['is_active'] == is_active):
+                # Extend current segment
+                segment['end'] = activity['_end_ts']
+            else:
+                segment = {
+                    'project': segment_project,
                     'start': timestamp,
-                    'end': timestamp + timedelta(seconds=duration),
+                    'end': activity['_end_ts'],
                     'is_active': is_active
                 }
-            elif current_segment['project'] == project and current_segment['is_active'] == is_active:
-                # Extend current segment
-                current_segment['end'] = timestamp + timedelta(seconds=duration)
+                segments.append(segment)
+
+            if row is not None and row['project'] == project and row['window_title'] == window:
+                # Merge with current row
+                row['duration'] += duration
             else:
-                # Start new segment
-                segments.append(current_segment)
-                current_segment = {
+                row = {
+                    'start_time': timestamp,
                     'project': project,
-                    'start': timestamp,
-                    'end': timestamp + timedelta(seconds=duration),
-                    'is_active': is_active
+                    'window_title': window,
+                    'duration': duration,
+                    'is_active': is_active,
+                    # Lowercased once here so filtering doesn't redo it per keystroke
+                    '_project_lc': segment_project.lower(),
+                    '_window_lc': (window or '').lower()
                 }
+                rows.append(row)
 
-        if current_segment:
-            segments.append(current_segment)
+        starts = [(s['start'] - day_start).total_seconds() for s in segments]
+        ends = [(s['end'] - day_start).total_seconds() for s in segments]
+        max_ends = list(itertools.accumulate(ends, max))
 
-        return segments
+        return {
+            'segments': segments,
+            'rows': rows,
+            'starts': starts,
+            'ends': ends,
+            'max_ends': max_ends
+        }
 
-    def _update_activity_list(self, activities: List[Dict], filter_text: str = ""):
+    def _update_activity_list(self, rows: Optional[List[Dict]] = None, filter_text: str = ""):
         """Update the activity list treeview with optional filtering."""
-        # Store activities for filtering
-        if activities:
-            self._current_activities = activities
+        # Store grouped rows for filtering
+        if rows is not None:
+            self._current_rows = rows
+        grouped = self._current_rows
 
-        # Clear existing items
-        for item in self._activity_tree.get_children():
-            self._activity_tree.delete(item)
+        # Detach the scrollbar so it isn't refreshed for every inserted row
+        self._activity_tree.configure(yscrollcommand='')
 
-        # Group activities to reduce noise
-        grouped = self._group_activities_for_list(self._current_activities)
+        # Clear existing items (one Tcl call for all rows)
+        children = self._activity_tree.get_children()
+        if children:
+            self._activity_tree.delete(*children)
 
-        # Apply filter
-        displayed_count = 0
+        # Apply filter; rows are only formatted once they are about to be shown
         total_count = len(grouped)
+        if filter_text:
+            matches = [
+                activity for activity in grouped
+                if filter_text in activity['_project_lc'] or filter_text in activity['_window_lc']
+            ]
+        else:
+            matches = grouped
+        displayed_count = len(matches)
 
-        for activity in grouped:
-            project = activity['project'] or 'Uncategorized'
-            window = activity['window_title']
-
-            # Filter check
-            if filter_text:
-                if filter_text not in project.lower() and filter_text not in window.lower():
-                    continue
-
-            displayed_count += 1
-
-            time_str = activity['start_time'].strftime('%H:%M')
-            duration_str = self._format_duration(activity['duration'])
-            window_display = window[:80] + '...' if len(window) > 80 else window
-
-            # Add IDLE indicator to project name
-            if not activity['is_active']:
-                project = f"[IDLE] {project}"
+        # Insert the first page only; the rest follows as the list is scrolled
+        self._pending_values = self._iter_display_values(matches)
+        self._append_list_page()
 
-            self._activity_tree.insert('', tk.END, values=(time_str, duration_str, project, window_display))
+        # Reattach the scrollbar; Tk pushes the final position once
+        self._activity_tree.configure(yscrollcommand=self._on_list_scroll)
 
         # Update filter count label
         if filter_text:
@@ -818,86 +1293,90 @@ class TimelineView:
         else:
             self._filter_count_label.config(text=f"{total_count} activities")
 
-    def _group_activities_for_list(self, activities: List[Dict]) -> List[Dict]:
-        """Group activities for display in list (merge consecutive same-project activities)."""
-        if not activities:
-            return []
-
-        grouped = []
-        current = None
+    def _iter_display_values(self, rows: List[Dict]) -> Iterator[tuple]:
+        """Yield the treeview values (time, duration, project, window) for each row."""
+        time_cache: Dict[tuple, str] = {}
+        last_window = last_window_display = None
 
-        for activity in activities:
-            # Show ALL activities, not just active ones
-            timestamp = datetime.fromisoformat(activity['timestamp'])
-            project = activity['project_name']
+        for activity in rows:
+            project = activity['project'] or UNCATEGORIZED
             window = activity['window_title']
-            duration = activity['duration_seconds']
-            is_active = activity['is_active']
 
-            if current is None:
-                current = {
-                    'start_time': timestamp,
-                    'project': project,
-                    'window_title': window,
-                    'duration': duration,
-                    'is_active': is_active
-                }
-            elif current['project'] == project and current['window_title'] == window:
-                # Merge with current
-                current['duration'] += duration
-            else:
-                grouped.append(current)
-                current = {
-                    'start_time': timestamp,
-                    'project': project,
-                    'window_title': window,
-                    'duration': duration,
-                    'is_active': is_active
-                }
+            start = activity['start_time']
+            time_key = (start.hour, start.minute)
+            time_str = time_cache.get(time_key)
+            if time_str is None:
+                time_str = time_cache[time_key] = f"{start.hour:02d}:{start.minute:02d}"
+            duration_str = _format_duration(activity['duration'])
+            # Adjacent rows often share a title; only truncate when it changes
+            if window != last_window:
+                last_window = window
+                if len(window) <= WINDOW_TITLE_MAX_CHARS:
+                    last_window_display = window
+                else:
+                    last_window_display = window[:WINDOW_TITLE_MAX_CHARS - 3] + '...'
+
+            # Add IDLE indicator to project name
+            if not activity['is_active']:
+                project = f"[IDLE] {project}"
 
-        if current:
-            grouped.append(current)
+            yield time_str, duration_str, project, last_window_display
 
-        return grouped
+    def _append_list_page(self):
+        """Insert the next page of pending rows at the end of the activity list."""
+        if self._pending_values is None:
+            return
+        page = list(itertools.islice(self._pending_values, LIST_PAGE_SIZE))
+        if len(page) < LIST_PAGE_SIZE:
+            self._pending_values = None
+
+        # Insert through tk.call directly, skipping Treeview.insert's option formatting
+        tk_call = self._activity_tree.tk.call
+        tree_w = self._activity_tree._w
+        for values in page:
+            tk_call(tree_w, 'insert', '', 'end', '-values', values)
+
+    def _on_list_scroll(self, first, last):
+        """Forward list scrolling to the scrollbar, loading more rows near the end."""
+        self._scrollbar.set(first, last)
+        if self._pending_values is not None and float(last) > 0.9:
+            self._append_list_page()
 
     def _update_summary(self, summary: List[Dict]):
         """Update the summary text."""
-        self._summary_text.config(state=tk.NORMAL)
-        self._summary_text.delete('1.0', tk.END)
-
+        # Build the whole text first so the widget is rewritten with a single insert
         if not summary:
-            self._summary_text.insert('1.0', "No activities recorded for this day.")
+            text = "No activities recorded for this day."
         else:
-            total_active = sum(s['active_seconds'] for s in summary)
-            total_all = sum(s.get('total_seconds', s['active_seconds']) for s in summary)
+            # One pass over the summary for both totals and the per-project lines
+            total_active = 0
+            total_all = 0
+            item_lines = []
+            for item in summary:
+                active_seconds = item['active_seconds']
+                total_active += active_seconds
+                total_all += item.get('total_seconds', active_seconds)
+                item_lines.append(f"  {item['project_name']}: {_format_duration(active_seconds)}")
             total_idle = total_all - total_active
 
             lines = [
-                f"Total Active Time: {self._format_duration(total_active)}",
-                f"    |    Idle Time: {self._format_duration(total_idle)}\n\n"
+                f"Total Active Time: {_format_duration(total_active)}"
+                f"    |    Idle Time: {_format_duration(total_idle)}",
+                ""
             ]
+            lines.extend(item_lines)
 
-            for item in summary:
-                project = item['project_name']
-                duration = self._format_duration(item['active_seconds'])
-                lines.append(f"  {project}: {duration}\n")
+            text = "\n".join(lines) + "\n"
 
-            self._summary_text.insert('1.0', ''.join(lines))
+        self._set_summary_text(text)
 
+    def _set_summary_text(self, text: str):
+        """Replace the summary panel's text."""
+        self._summary_text.config(state=tk.NORMAL)
+        self._summary_text.delete('1.0', tk.END)
+        self._summary_text.insert('1.0', text)
         self._summary_text.config(state=tk.DISABLED)
 
-    def _format_duration(self, seconds: int) -> str:
-        """Format seconds as human-readable duration."""
-        if seconds < 60:
-            return f"{seconds}s"
-
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        return f"{minutes}m"
-
     def _prev_day(self):
         """Go to previous day."""
         self._selected_date -= timedelta(days=1)
@@ -924,33 +1403,35 @@ class TimelineView:
         self._update_zoom_label()
 
     def _safe_refresh(self):
-        """Refresh with proper UI update handling."""
+        """Refresh, logging instead of raising (the day itself loads in the background)."""
         if self.window is None:
             return
         try:
-            self.window.config(cursor="wait")
-            self.window.update()
             self._refresh()
         except Exception as e:
             logger.error(f"Error refreshing timeline: {e}")
-        finally:
-            try:
-                self.window.config(cursor="")
-                self.window.update()
-            except Exception:
-                pass
 
     def close(self):
         """Close the timeline window."""
-        print(">>> DEBUG: timeline close() called")
+        logger.debug("TimelineView.close() called")
         if self.window:
-            print(">>> DEBUG: Destroying timeline window")
+            logger.debug("Destroying timeline window")
             try:
+                for after_id in (self._redraw_after_id, self._filter_after_id, self._motion_after_id):
+                    if after_id is not None:
+                        self.window.after_cancel(after_id)
+                self._redraw_after_id = None
+                self._filter_after_id = None
+                self._motion_after_id = None
+                self._day_cache.clear()
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
                 self.window.destroy()
                 self.window = None
-                print(">>> DEBUG: Timeline window destroyed")
+                logger.debug("Timeline window destroyed")
             except Exception as e:
-                print(f">>> DEBUG: Error closing timeline: {e}")
+                logger.debug("Error closing timeline: %s", e)
 
 
 if __name__ == "__main__":
@@ -27,6 +27,8 @@ class TrayApp:
     """
 
     ICON_SIZE = 64
+    UPDATE_DELAY = 0.1  # Seconds to coalesce state changes into one icon/menu update
+    _clock_mask = None  # Clock glyph mask shared by all icon images (see _get_clock_mask)
     COLORS = {
         'active': '#4CAF50',      # Green when actively tracking
         'idle': '#FFC107',        # Yellow when idle
@@ -40,6 +42,10 @@ class TrayApp:
         self._current_project = "No Project"
         self._is_active = True
         self._is_paused = False
+        self._icon_cache: Dict[str, 'Image'] = {}  # Rendered icon per status
+        self._last_render_key: Optional[tuple] = None  # (status, project) last pushed to the icon
+        self._update_timer: Optional[threading.Timer] = None  # Pending coalesced update
+        self._update_lock = threading.Lock()
 
         # Callbacks for menu actions
         self._on_show_timeline: Optional[Callable] = None
@@ -90,14 +96,28 @@ class TrayApp:
             fill=color
         )
 
+        # Stamp the shared clock glyph in white
+        image.paste('white', mask=self._get_clock_mask())
+        return image
+
+    @classmethod
+    def _get_clock_mask(cls) -> 'Image':
+        """Return the clock glyph as an 'L' mask, drawn once and shared by every status."""
+        if cls._clock_mask is not None:
+            return cls._clock_mask
+
+        mask = Image.new('L', (cls.ICON_SIZE, cls.ICON_SIZE), 0)
+        draw = ImageDraw.Draw(mask)
+        padding = 4
+
         # Draw a simple clock/timer icon in the center
-        center = self.ICON_SIZE // 2
-        radius = (self.ICON_SIZE - padding * 2) // 2 - 8
+        center = cls.ICON_SIZE // 2
+        radius = (cls.ICON_SIZE - padding * 2) // 2 - 8
 
         # Clock circle outline
         draw.ellipse(
             [center - radius, center - radius, center + radius, center + radius],
-            outline='white',
+            outline=255,
             width=3
         )
 
@@ -105,16 +125,24 @@ class TrayApp:
         # Hour hand (shorter)
         draw.line(
             [center, center, center, center - radius + 8],
-            fill='white',
+            fill=255,
             width=3
         )
         # Minute hand (longer)
         draw.line(
             [center, center, center + radius - 8, center],
-            fill='white',
+            fill=255,
             width=2
         )
 
+        cls._clock_mask = mask
+        return mask
+
+    def _get_icon_image(self, status: str) -> 'Image':
+        """Return the icon image for a status, rendering it on first use."""
+        image = self._icon_cache.get(status)
+        if image is None:
+            image = self._icon_cache[status] = self._create_icon_image(status)
         return image
 
     def _create_menu(self) -> pystray.Menu:
@@ -169,71 +197,105 @@ class TrayApp:
             )
         )
 
+    def _dispatch(self, callback: Callable, *args):
+        """Run a menu callback on its own thread so it can't stall the tray's event loop."""
+        threading.Thread(target=callback, args=args, daemon=True).start()
+
     def _handle_show_timeline(self, icon, item):
         """Handle timeline menu click."""
         if self._on_show_timeline:
-            self._on_show_timeline()
+            self._dispatch(self._on_show_timeline)
 
     def _handle_show_reports(self, icon, item):
         """Handle reports menu click."""
         if self._on_show_reports:
-            self._on_show_reports()
+            self._dispatch(self._on_show_reports)
 
     def _handle_show_settings(self, icon, item):
         """Handle settings menu click."""
         if self._on_show_settings:
-            self._on_show_settings()
+            self._dispatch(self._on_show_settings)
 
     def _handle_show_mappings(self, icon, item):
         """Handle project mappings menu click."""
         if self._on_show_mappings:
-            self._on_show_mappings()
+            self._dispatch(self._on_show_mappings)
 
     def _handle_toggle_pause(self, icon, item):
         """Handle pause/resume menu click."""
         self._is_paused = not self._is_paused
-        self._update_icon()
+        self._request_update()
+        # Not dispatched: it only flips a flag, and quick toggles must apply in order
         if self._on_toggle_pause:
             self._on_toggle_pause(self._is_paused)
 
     def _handle_exit(self, icon, item):
         """Handle exit menu click."""
+        # Not dispatched: the exit callback must run before the tray loop returns
         self.stop()
         if self._on_exit:
             self._on_exit()
 
+    def _get_status(self) -> str:
+        """Return the current icon status: 'active', 'idle', or 'paused'."""
+        if self._is_paused:
+            return 'paused'
+        if self._is_active:
+            return 'active'
+        return 'idle'
+
     def _update_icon(self):
-        """Update the tray icon based on current state."""
+        """Update the tray icon and menu, skipping whatever hasn't changed."""
         if self._icon is None:
             return
 
-        if self._is_paused:
-            status = 'paused'
-        elif self._is_active:
-            status = 'active'
-        else:
-            status = 'idle'
+        status = self._get_status()
+        render_key = (status, self._current_project)
+        last_key = self._last_render_key
+        if render_key == last_key:
+            return
 
-        self._icon.icon = self._create_icon_image(status)
+        # The menu shows both status and project; the image only the status
+        if last_key is None or last_key[0] != status:
+            self._icon.icon = self._get_icon_image(status)
         self._icon.menu = self._create_menu()
+        self._last_render_key = render_key
+
+    def _request_update(self):
+        """Schedule an icon/menu update, coalescing bursts of state changes into one."""
+        # Nothing to redraw: skip arming a timer (update_project is called every second)
+        if self._icon is None or (self._get_status(), self._current_project) == self._last_render_key:
+            return
+        with self._update_lock:
+            if self._update_timer is not None:
+                return  # Already pending; it will pick up the latest state
+            timer = threading.Timer(self.UPDATE_DELAY, self._flush_update)
+            timer.daemon = True
+            self._update_timer = timer
+        timer.start()
+
+    def _flush_update(self):
+        """Apply the pending icon/menu update (runs on the timer thread)."""
+        with self._update_lock:
+            self._update_timer = None
+        self._update_icon()
 
     def update_project(self, project_name: str):
         """Update the current project display."""
         self._current_project = project_name or "No Project"
-        if self._icon:
-            self._icon.menu = self._create_menu()
+        self._request_update()
 
     def update_activity_state(self, is_active: bool):
         """Update the activity state (active vs idle)."""
         if self._is_active != is_active:
             self._is_active = is_active
-            self._update_icon()
+            self._request_update()
 
     def update_pause_state(self, is_paused: bool):
         """Update the pause state."""
         if self._is_paused != is_paused:
             self._is_paused = is_paused
-            self._update_icon()
+            self._request_update()
 
     def show_notification(self, title: str, message: str):
         """Show a notification balloon."""
@@ -258,17 +320,22 @@ class TrayApp:
         if self._running:
             return
 
+        status = self._get_status()
         self._icon = pystray.Icon(
             name="ActivityMonitor",
-            icon=self._create_icon_image('active'),
+            icon=self._get_icon_image(status),
             title="ActivityMonitor - Tracking",
             menu=self._create_menu()
         )
+        self._last_render_key = (status, self._current_project)
 
         self._running = True
 
         if blocking:
             self._icon.run()
+        elif hasattr(self._icon, 'run_detached'):
+            # pystray >= 0.19 starts its own loop thread where the backend needs one
+            self._icon.run_detached()
         else:
             thread = threading.Thread(target=self._icon.run, daemon=True)
             thread.start()
@@ -276,9 +343,14 @@ class TrayApp:
     def stop(self):
         """Stop the tray application."""
         self._running = False
+        with self._update_lock:
+            if self._update_timer is not None:
+                self._update_timer.cancel()
+                self._update_timer = None
         if self._icon:
             self._icon.stop()
             self._icon = None
+        self._last_render_key = None
 
 
 if __name__ == "__main__":
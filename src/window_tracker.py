@@ -4,10 +4,12 @@ Tracks the currently active (foreground) window on Windows.
 """
 
 import ctypes
+import functools
 from ctypes import wintypes
-from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -15,21 +17,76 @@ logger = logging.getLogger(__name__)
 # Windows API constants and functions
 user32 = ctypes.windll.user32
 kernel32 = ctypes.windll.kernel32
-psapi = ctypes.windll.psapi
+try:
+    dwmapi = ctypes.windll.dwmapi
+except OSError:
+    dwmapi = None  # Desktop Window Manager API missing; window bounds use GetWindowRect
+
+# Callback types for EnumWindows and SetWinEventHook
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
 
 # Function prototypes
 user32.GetForegroundWindow.restype = wintypes.HWND
 user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
 user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
 user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+user32.IsWindowVisible.argtypes = [wintypes.HWND]
+user32.IsWindowVisible.restype = wintypes.BOOL
+user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+user32.EnumWindows.restype = wintypes.BOOL
+user32.SetWinEventHook.argtypes = [
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WINEVENTPROC,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+]
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+user32.UnhookWinEvent.restype = wintypes.BOOL
+user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+user32.GetMessageW.restype = wintypes.BOOL
+user32.TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+user32.DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.PostThreadMessageW.restype = wintypes.BOOL
 
 kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
 kernel32.OpenProcess.restype = wintypes.HANDLE
 kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.GetProcessTimes.argtypes = [
+    wintypes.HANDLE, ctypes.POINTER(wintypes.FILETIME), ctypes.POINTER(wintypes.FILETIME),
+    ctypes.POINTER(wintypes.FILETIME), ctypes.POINTER(wintypes.FILETIME)
+]
+kernel32.GetProcessTimes.restype = wintypes.BOOL
+
+# Process image names come from QueryFullProcessImageNameW (Vista and later)
+QUERY_IMAGE_NAME_AVAILABLE = hasattr(kernel32, 'QueryFullProcessImageNameW')
+if QUERY_IMAGE_NAME_AVAILABLE:
+    kernel32.QueryFullProcessImageNameW.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)
+    ]
+    kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+else:
+    logger.warning("QueryFullProcessImageNameW not available. Process names will be reported as Unknown.")
 
-PROCESS_QUERY_INFORMATION = 0x0400
-PROCESS_VM_READ = 0x0010
 PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+DWMWA_EXTENDED_FRAME_BOUNDS = 9
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+WM_QUIT = 0x0012
+
+# Window titles are read in one call into a buffer of this many characters
+WINDOW_TITLE_BUFFER_SIZE = 512
+
+# Process name cache: entries are re-validated against the process creation
+# time this often; past the size limit the oldest entry is evicted instead
+PROCESS_CACHE_PRUNE_SECONDS = 60.0
+PROCESS_CACHE_MAX_SIZE = 512
+
+# Foreground window bounds are re-read at most this often while the window stays the same
+WINDOW_RECT_CACHE_SECONDS = 5.0
 
 
 class POINT(ctypes.Structure):
@@ -47,14 +104,69 @@ class RECT(ctypes.Structure):
     ]
 
 
-@dataclass
+user32.GetCursorPos.argtypes = [ctypes.POINTER(POINT)]
+user32.GetCursorPos.restype = wintypes.BOOL
+user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(RECT)]
+user32.GetWindowRect.restype = wintypes.BOOL
+# DWM frame bounds are in physical pixels, which only match GetCursorPos
+# coordinates once the process is DPI aware
+DPI_AWARENESS_QUERY_AVAILABLE = hasattr(user32, 'IsProcessDPIAware')
+if DPI_AWARENESS_QUERY_AVAILABLE:
+    user32.IsProcessDPIAware.argtypes = []
+    user32.IsProcessDPIAware.restype = wintypes.BOOL
+if dwmapi is not None:
+    dwmapi.DwmGetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+    dwmapi.DwmGetWindowAttribute.restype = ctypes.c_long  # HRESULT
+
+
+@functools.lru_cache(maxsize=512)
+def _basename(path: str) -> str:
+    """Return the file name part of a Windows path (processes recur, so this is memoized)."""
+    return path[max(path.rfind('\\'), path.rfind('/')) + 1:]
+
+
 class WindowInfo:
-    """Information about the current foreground window."""
-    handle: int
-    title: str
-    process_name: str
-    process_id: int
-    cursor_in_window: bool = True  # Is mouse cursor within window bounds?
+    """
+    Information about the current foreground window.
+
+    cursor_in_window (is the mouse cursor within the window bounds?) is either
+    given explicitly or, when created by a WindowTracker, looked up on first
+    access so callers that never read it don't pay for the Win32 calls.
+    """
+
+    __slots__ = ('handle', 'title', 'process_name', 'process_id',
+                 '_tracker', '_cursor_in_window')
+
+    def __init__(self, handle: int, title: str, process_name: str, process_id: int,
+                 cursor_in_window: Optional[bool] = None,
+                 tracker: Optional['WindowTracker'] = None):
+        self.handle = handle
+        self.title = title
+        self.process_name = process_name
+        self.process_id = process_id
+        self._tracker = tracker
+        self._cursor_in_window = cursor_in_window
+
+    @property
+    def cursor_in_window(self) -> bool:
+        """Is the mouse cursor within the window bounds? (Computed once, on first access.)"""
+        if self._cursor_in_window is None:
+            tracker = self._tracker
+            self._cursor_in_window = tracker._is_cursor_in_window(self.handle) if tracker else True
+            self._tracker = None
+        return self._cursor_in_window
+
+    def __eq__(self, other):
+        if not isinstance(other, WindowInfo):
+            return NotImplemented
+        return (self.handle == other.handle and self.title == other.title and
+                self.process_name == other.process_name and self.process_id == other.process_id)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"WindowInfo(handle={self.handle!r}, title={self.title!r}, "
+                f"process_name={self.process_name!r}, process_id={self.process_id!r})")
 
     def __str__(self):
         return f"{self.process_name}: {self.title}"
@@ -64,66 +176,115 @@ class WindowTracker:
     """Tracks the currently active window."""
 
     def __init__(self):
+        # The foreground hook thread and the polling thread share one tracker:
+        # every public entry point holds this lock while it uses the reused
+        # buffers below, the process name cache or _last_window
+        self._lock = threading.RLock()
         self._last_window: Optional[WindowInfo] = None
+        # Win32 out-parameters, allocated once and reused by every call
+        self._title_buf = ctypes.create_unicode_buffer(WINDOW_TITLE_BUFFER_SIZE)
+        self._pname_buf = ctypes.create_unicode_buffer(260)
+        self._pname_size = wintypes.DWORD(260)
+        self._pid_buf = wintypes.DWORD()
+        self._point_buf = POINT()
+        self._rect_buf = RECT()
+        self._times_buf = tuple(wintypes.FILETIME() for _ in range(4))  # creation, exit, kernel, user
+        # EnumWindows callback, created once; (hwnd, title, pid) collect in _enum_buf
+        self._enum_buf: List[Tuple[int, str, int]] = []
+        self._enum_callback = WNDENUMPROC(self._enum_callback_impl)
+        # Maps PID -> (process creation time, process name); the creation time
+        # ties an entry to one process instance so reused PIDs are detected
+        self._pid_name_cache: Dict[int, Tuple[int, str]] = {}
+        self._next_cache_prune = time.monotonic() + PROCESS_CACHE_PRUNE_SECONDS
+        # Window whose bounds _rect_buf holds, and when they were read: (hwnd, read at)
+        self._rect_cache: Optional[Tuple[int, float]] = None
+        # Foreground-change hook (see start_hook)
+        self._hook_callback: Optional[Callable[[Optional[WindowInfo]], None]] = None
+        self._hook_proc = WINEVENTPROC(self._on_win_event)
+        self._hook_thread: Optional[threading.Thread] = None
+        self._hook_thread_id = 0
 
     def get_active_window(self) -> Optional[WindowInfo]:
         """Get information about the currently active window."""
-        try:
-            hwnd = user32.GetForegroundWindow()
-            if not hwnd:
-                return None
-
-            # Get window title
-            title = self._get_window_title(hwnd)
+        with self._lock:
+            try:
+                hwnd = user32.GetForegroundWindow()
+                if not hwnd:
+                    return None
 
-            # Get process information
-            process_id = self._get_window_process_id(hwnd)
-            process_name = self._get_process_name(process_id) if process_id else "Unknown"
+                # Get window title
+                title = self._get_window_title(hwnd)
 
-            # Check if cursor is within window bounds (for multi-monitor accuracy)
-            cursor_in_window = self._is_cursor_in_window(hwnd)
+                # Get process information
+                process_id = self._get_window_process_id(hwnd)
+                process_name = self._get_process_name(process_id) if process_id else "Unknown"
 
-            window_info = WindowInfo(
-                handle=hwnd,
-                title=title,
-                process_name=process_name,
-                process_id=process_id or 0,
-                cursor_in_window=cursor_in_window
-            )
+                # Cursor-in-window (for multi-monitor accuracy) is checked lazily on access
+                window_info = WindowInfo(
+                    handle=hwnd,
+                    title=title,
+                    process_name=process_name,
+                    process_id=process_id or 0,
+                    tracker=self
+                )
 
-            self._last_window = window_info
-            return window_info
+                self._last_window = window_info
+                return window_info
 
-        except Exception as e:
-            logger.error(f"Error getting active window: {e}")
-            return self._last_window
+            except Exception as e:
+                logger.error(f"Error getting active window: {e}")
+                return self._last_window
 
     def _is_cursor_in_window(self, hwnd: int) -> bool:
         """Check if the mouse cursor is within the window bounds."""
-        try:
-            # Get cursor position
-            cursor = POINT()
-            user32.GetCursorPos(ctypes.byref(cursor))
-
-            # Get window rectangle
-            rect = RECT()
+        with self._lock:
+            try:
+                # Get cursor position
+                cursor = self._point_buf
+                user32.GetCursorPos(ctypes.byref(cursor))
+
+                # Get window rectangle
+                rect = self._get_window_bounds(hwnd)
+
+                # Check if cursor is within bounds
+                return (rect.left <= cursor.x <= rect.right and
+                        rect.top <= cursor.y <= rect.bottom)
+            except Exception:
+                return True  # Assume in window if we can't determine
+
+    def _get_window_bounds(self, hwnd: int) -> RECT:
+        """Get a window's visible bounds, reusing the last result for the same window."""
+        now = time.monotonic()
+        rect = self._rect_buf
+        cached = self._rect_cache
+        if cached is not None and cached[0] == hwnd and now - cached[1] < WINDOW_RECT_CACHE_SECONDS:
+            return rect
+
+        # The DWM frame bounds exclude the invisible resize borders GetWindowRect
+        # includes, but are not DPI-virtualized: for a DPI-unaware process they
+        # would not match the cursor position on a scaled display
+        if not self._use_dwm_bounds() or dwmapi.DwmGetWindowAttribute(
+                hwnd, DWMWA_EXTENDED_FRAME_BOUNDS, ctypes.byref(rect), ctypes.sizeof(rect)) != 0:
             user32.GetWindowRect(hwnd, ctypes.byref(rect))
 
-            # Check if cursor is within bounds
-            return (rect.left <= cursor.x <= rect.right and
-                    rect.top <= cursor.y <= rect.bottom)
+        self._rect_cache = (hwnd, now)
+        return rect
+
+    @staticmethod
+    def _use_dwm_bounds() -> bool:
+        """Can window bounds come from DWM (available, and this process is DPI aware)?"""
+        try:
+            return dwmapi is not None and DPI_AWARENESS_QUERY_AVAILABLE and bool(user32.IsProcessDPIAware())
         except Exception:
-            return True  # Assume in window if we can't determine
+            return False
 
     def _get_window_title(self, hwnd: int) -> str:
         """Get the title of a window."""
         try:
-            length = user32.GetWindowTextLengthW(hwnd)
-            if length == 0:
+            # One call into a reused buffer; longer titles are truncated
+            buffer = self._title_buf
+            if not user32.GetWindowTextW(hwnd, buffer, WINDOW_TITLE_BUFFER_SIZE):
                 return ""
-
-            buffer = ctypes.create_unicode_buffer(length + 1)
-            user32.GetWindowTextW(hwnd, buffer, length + 1)
             return buffer.value
         except Exception:
             return ""
@@ -131,15 +292,36 @@ class WindowTracker:
     def _get_window_process_id(self, hwnd: int) -> Optional[int]:
         """Get the process ID of a window."""
         try:
-            pid = wintypes.DWORD()
+            pid = self._pid_buf
+            pid.value = 0
             user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
             return pid.value if pid.value else None
         except Exception:
             return None
 
-    def _get_process_name(self, pid: int) -> str:
-        """Get the process name from a process ID."""
-        # Try QueryFullProcessImageNameW first (works for elevated processes)
+    def _get_process_name(self, pid: int, verify: bool = True) -> str:
+        """
+        Get the process name from a process ID (cached per process instance).
+
+        Args:
+            pid: Process ID
+            verify: Check a cached name against the live process's creation time
+                    before using it, since PIDs are reused quickly. Only the bulk
+                    get_all_windows scan skips this and relies on the timed prune.
+        """
+        now = time.monotonic()
+        if now >= self._next_cache_prune:
+            self._prune_process_cache()
+            self._next_cache_prune = now + PROCESS_CACHE_PRUNE_SECONDS
+
+        cached = self._pid_name_cache.get(pid)
+        if cached is not None and not verify:
+            return cached[1]
+
+        start_time = None
+        name = "Unknown"
+
+        # QueryFullProcessImageNameW only needs limited rights, so it works for elevated processes
         try:
             handle = kernel32.OpenProcess(
                 PROCESS_QUERY_LIMITED_INFORMATION,
@@ -148,39 +330,126 @@ class WindowTracker:
             )
             if handle:
                 try:
-                    buffer = ctypes.create_unicode_buffer(260)
-                    size = wintypes.DWORD(260)
-                    # QueryFullProcessImageNameW: kernel32 function
-                    result = kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size))
-                    if result and buffer.value:
-                        # Extract just the filename from full path
-                        import os
-                        return os.path.basename(buffer.value)
+                    start_time = self._get_process_start_time(handle)
+                    if cached is not None and start_time is not None and start_time == cached[0]:
+                        return cached[1]  # Same process instance: skip the image name query
+                    if QUERY_IMAGE_NAME_AVAILABLE:
+                        buffer = self._pname_buf
+                        size = self._pname_size
+                        size.value = 260  # In/out: buffer size in, path length out
+                        result = kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size))
+                        if result and buffer.value:
+                            # Extract just the filename from full path
+                            name = _basename(buffer.value)
                 finally:
                     kernel32.CloseHandle(handle)
         except Exception:
             pass
 
-        # Fallback: try GetModuleBaseNameW (original method)
+        # Only cache names we can tie to a process instance
+        if start_time is not None:
+            cache = self._pid_name_cache
+            cache[pid] = (start_time, name)
+            if len(cache) > PROCESS_CACHE_MAX_SIZE:
+                del cache[next(iter(cache))]  # Dicts keep insertion order: oldest first
+        return name
+
+    def _get_process_start_time(self, handle: int) -> Optional[int]:
+        """Get a process's creation time (FILETIME ticks) from an open handle."""
         try:
-            handle = kernel32.OpenProcess(
-                PROCESS_QUERY_INFORMATION | PROCESS_VM_READ,
-                False,
-                pid
-            )
+            creation, exit_time, kernel_time, user_time = self._times_buf
+            if not kernel32.GetProcessTimes(handle, ctypes.byref(creation), ctypes.byref(exit_time),
+                                            ctypes.byref(kernel_time), ctypes.byref(user_time)):
+                return None
+            return (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+        except Exception:
+            return None
+
+    def _prune_process_cache(self):
+        """Drop cached names of processes that exited or whose PID was reused."""
+        for pid, (start_time, _) in list(self._pid_name_cache.items()):
+            current_start = None
+            try:
+                handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+                if handle:
+                    try:
+                        current_start = self._get_process_start_time(handle)
+                    finally:
+                        kernel32.CloseHandle(handle)
+            except Exception:
+                pass
+            if current_start != start_time:
+                del self._pid_name_cache[pid]
+
+    def start_hook(self, callback: Callable[[Optional[WindowInfo]], None]) -> bool:
+        """
+        Call back on foreground window changes instead of being polled.
+
+        Installs a SetWinEventHook(EVENT_SYSTEM_FOREGROUND) on a background
+        thread running a message loop. On every change the new window is looked
+        up once with get_active_window() and passed to the callback, which runs
+        on that thread. Polling the tracker from other threads meanwhile is safe.
+
+        Returns:
+            True if the hook was installed
+        """
+        if self._hook_thread is not None:
+            return True
 
-            if not handle:
-                return "Unknown"
+        self._hook_callback = callback
+        ready = threading.Event()
+        installed = []
 
+        def run():
+            self._hook_thread_id = kernel32.GetCurrentThreadId()
+            # Out-of-context hooks are delivered to the installing thread's message queue
+            hook = user32.SetWinEventHook(
+                EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND, None,
+                self._hook_proc, 0, 0, WINEVENT_OUTOFCONTEXT
+            )
+            installed.append(bool(hook))
+            ready.set()
+            if not hook:
+                return
             try:
-                buffer = ctypes.create_unicode_buffer(260)
-                psapi.GetModuleBaseNameW(handle, None, buffer, 260)
-                return buffer.value if buffer.value else "Unknown"
+                msg = wintypes.MSG()
+                while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                    user32.TranslateMessage(ctypes.byref(msg))
+                    user32.DispatchMessageW(ctypes.byref(msg))
             finally:
-                kernel32.CloseHandle(handle)
-
-        except Exception:
-            return "Unknown"
+                user32.UnhookWinEvent(hook)
+
+        thread = threading.Thread(target=run, name="foreground-hook", daemon=True)
+        thread.start()
+        ready.wait()
+
+        if not installed[0]:
+            logger.error("Failed to install foreground window hook")
+            self._hook_callback = None
+            return False
+
+        self._hook_thread = thread
+        return True
+
+    def stop_hook(self):
+        """Remove the foreground-change hook and stop its message loop."""
+        thread = self._hook_thread
+        if thread is None:
+            return
+        user32.PostThreadMessageW(self._hook_thread_id, WM_QUIT, 0, 0)
+        thread.join(timeout=2)
+        self._hook_thread = None
+        self._hook_callback = None
+
+    def _on_win_event(self, hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        """WinEventProc for EVENT_SYSTEM_FOREGROUND (runs on the hook thread)."""
+        callback = self._hook_callback
+        if callback is None:
+            return
+        try:
+            callback(self.get_active_window())
+        except Exception as e:
+            logger.error(f"Error in foreground change callback: {e}")
 
     @property
     def last_window(self) -> Optional[WindowInfo]:
@@ -189,12 +458,22 @@ class WindowTracker:
 
     def has_window_changed(self) -> bool:
         """Check if the active window has changed since last check."""
-        current = self.get_active_window()
-        if current is None or self._last_window is None:
-            return True
+        with self._lock:
+            last = self._last_window
+            try:
+                hwnd = user32.GetForegroundWindow()
+            except Exception as e:
+                logger.error(f"Error getting foreground window: {e}")
+                return True
+
+            # Same window: only its title can have changed, which is cheap to check
+            if last is not None and hwnd and hwnd == last.handle:
+                if self._get_window_title(hwnd) == last.title:
+                    return False
 
-        return (current.handle != self._last_window.handle or
-                current.title != self._last_window.title)
+            # Different window or new title: refresh the full info (updates last_window)
+            self.get_active_window()
+            return True
 
     def get_all_windows(self) -> list:
         """
@@ -203,46 +482,53 @@ class WindowTracker:
         Returns a list of WindowInfo objects for all visible windows.
         Useful for detecting background activity like Teams meetings.
         """
-        windows = []
-
-        def enum_callback(hwnd, _):
-            """Callback for EnumWindows."""
-            try:
-                # Skip invisible windows
-                if not user32.IsWindowVisible(hwnd):
-                    return True
-
-                # Get window title
-                title = self._get_window_title(hwnd)
-                if not title:  # Skip windows without title
-                    return True
-
-                # Get process info
-                process_id = self._get_window_process_id(hwnd)
-                process_name = self._get_process_name(process_id) if process_id else "Unknown"
-
-                window_info = WindowInfo(
-                    handle=hwnd,
-                    title=title,
-                    process_name=process_name,
-                    process_id=process_id or 0,
-                    cursor_in_window=False  # Not relevant for enumeration
-                )
-                windows.append(window_info)
-
-            except Exception as e:
-                logger.debug(f"Error enumerating window {hwnd}: {e}")
-
-            return True  # Continue enumeration
+        with self._lock:
+            self._enum_buf = []
+
+            # Enumerate all top-level windows
+            user32.EnumWindows(self._enum_callback, 0)
+            found = self._enum_buf
+            self._enum_buf = []
+
+            # Resolve each process name once, however many windows the process has
+            process_names = {
+                pid: self._get_process_name(pid, verify=False)
+                for pid in {pid for _, _, pid in found if pid}
+            }
+
+        return [
+            WindowInfo(
+                handle=hwnd,
+                title=title,
+                process_name=process_names.get(pid, "Unknown"),
+                process_id=pid,
+                cursor_in_window=False  # Not relevant for enumeration
+            )
+            for hwnd, title, pid in found
+        ]
 
-        # Define the callback type
-        WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
-        callback = WNDENUMPROC(enum_callback)
+    def _enum_callback_impl(self, hwnd, _):
+        """Callback for EnumWindows."""
+        try:
+            # Skip invisible windows
+            if not user32.IsWindowVisible(hwnd):
+                return True
+
+            # Get window title (inlined _get_window_title; this runs once per window)
+            buffer = self._title_buf
+            if not user32.GetWindowTextW(hwnd, buffer, WINDOW_TITLE_BUFFER_SIZE):
+                return True  # Skip windows without title
+
+            # Process names are resolved after enumeration (see get_all_windows)
+            pid = self._pid_buf
+            pid.value = 0
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            self._enum_buf.append((hwnd, buffer.value, pid.value))
 
-        # Enumerate all top-level windows
-        user32.EnumWindows(callback, 0)
+        except Exception as e:
+            logger.debug(f"Error enumerating window {hwnd}: {e}")
 
-        return windows
+        return True  # Continue enumeration
 
 
 def get_active_window_info() -> Optional[WindowInfo]: